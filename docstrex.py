@@ -24,16 +24,47 @@ is shown first in the documentation for the Python package.
 # <--------------------------------------- 100 characters ---------------------------------------> #
 
 
+# `concurrent.futures`, `subprocess`, and `tempfile` are only needed for HTML conversion and
+# the unit tests, and `shutil` is only needed to search the `PATH`, so they are imported by the
+# functions that use them:
+import ast
 from dataclasses import dataclass, field
-import importlib
+import functools
+import hashlib
 import inspect
+import itertools
+import json
 import os
 from pathlib import Path
-import shutil  # Used for shutil.which()
-import subprocess
+import re
+import stat
+import string
 import sys
-import tempfile  # Used for unit tests.
-from typing import Any, Callable, cast, Dict, IO, List, Optional, Sequence, Tuple
+from typing import (Any, Callable, cast, Dict, IO, Iterator, List, Optional, Sequence, Tuple,
+                    Union)
+
+# Markdown anchors are lower case with underscores converted to hyphens.  This is done in
+# a single pass with `str.translate()`:
+_ANCHOR_TABLE: Dict[int, int] = str.maketrans(
+    "_" + string.ascii_uppercase, "-" + string.ascii_lowercase)
+
+# Matches the leading white space of each line that is not empty:
+_INDENT_RE: "re.Pattern[str]" = re.compile(r"^([^\S\n]*)\S", re.MULTILINE)
+
+# Paths are immutable, so the fixed ones are constructed once and shared:
+_CURRENT_DIRECTORY: Path = Path(".")
+_README_PATH: Path = Path("README.md")
+_BUILD_CACHE_PATH: Path = Path(".docstrex_cache.json")
+
+# Starting a pool of worker processes only pays off when there are enough Python files:
+_PARALLEL_THRESHOLD: int = 4
+
+# Streamed markdown files are written through a 64KB buffer, so that a typical file is written
+# with only a few `write()` system calls:
+_WRITE_BUFFER_SIZE: int = 1 << 16
+
+# Trace output is only produced when the `DOCSTREX_TRACE` environment variable is set:
+_TRACING: str = " " if os.environ.get("DOCSTREX_TRACE") else ""
 
 
 # PyBase:
@@ -53,6 +84,9 @@ class PyBase(object):
        have underscores converted to hyphens.
     * *Number* (str):
        The Table of contents number as a string.  '#" for classes and "#.#" for functions.
+    * *Summary* (str):
+       The table of contents entry without its indentation.  It is assembled once by the
+       *annotate_self*() method so that rendering only has to prepend the indentation.
 
     """
 
@@ -60,6 +94,7 @@ class PyBase(object):
     Lines: Tuple[str, ...] = field(init=False, repr=False, default=())
     Anchor: str = field(init=False, repr=False, default="")
     Number: str = field(init=False, repr=False, default="??")
+    Summary: str = field(init=False, repr=False, default="")
 
     # PyBase.set_lines():
     def set_lines(self, doc_string: Optional[str]) -> None:
@@ -69,49 +104,42 @@ class PyBase(object):
         * *doc_string* (Optional[str]):
            A raw documentation string or None if no documentation string is present.
 
-        *doc_string* is split into lines.  Both the first line and all subsequent empty lines
-        are used to determine the actual doc string indentation level.  The approproiate
-        lines have their indentation padding removed before being stored into PyBase.Lines
-        attributes.
+        *doc_string* is split into lines.  All lines after the first one are used to determine
+        the actual doc string indentation level (empty lines are ignored.)  These lines have
+        their indentation padding removed before being stored into PyBase.Lines attributes.
 
         """
         self.Lines = ("NO DOC STRING!",)
         if isinstance(doc_string, str):
-            line: str
-            lines: List[str] = [line.rstrip() for line in doc_string.split("\n")]
-
-            # Compute the *common_indent* in spaces ignoring empty lines:
-            big: int = 123456789
-            common_indent: int = big
             # The first line of a doc string has no indentation padding, but all other lines do.
-            for line in lines[1:]:
-                indent: int = len(line) - len(line.lstrip())
-                if line:  # Skip empty lines:
-                    common_indent = min(common_indent, indent)
-            if common_indent == big:
-                common_indent = 0
+            # One line doc strings (the common case) skip the indentation analysis entirely:
+            first_line: str
+            newline: str
+            body: str
+            first_line, newline, body = doc_string.partition("\n")
+            line: str
+            lines: List[str] = [first_line.rstrip()]
+            if newline:
+                # Compute the *common_indent* ignoring empty lines and strip it off of each line:
+                common_indent: int = min(
+                    (len(indent) for indent in _INDENT_RE.findall(body)), default=0)
+                lines.extend(line.rstrip()[common_indent:] for line in body.split("\n"))
 
             # Convert "NAME: Summary line." => "Summary_line.":
-            first_line: str = lines[0]
+            first_line = lines[0]
             pattern: str = f"{self.Name}: "
             if first_line.startswith(pattern):
                 lines[0] = first_line[len(pattern):]
 
-            # Strip the common indentation off of each *line*:
-            index: int
-            for index, line in enumerate(lines):
-                if index > 0 and len(line) >= common_indent:
-                    lines[index] = line[common_indent:]
-
-            # Strip off blank lines from the end:
-            while lines and lines[-1] == "":
-                lines.pop()
-
-            # Strip off blank lines between summary line and body:
-            while len(lines) >= 2 and lines[1] == "":
-                del(lines[1])
-
-            self.Lines = tuple(lines)
+            # Strip off blank lines from the end and between the summary line and the body.
+            # The indices are found first, so that the list is only sliced once:
+            end: int = len(lines)
+            while end > 1 and lines[end - 1] == "":
+                end -= 1
+            start: int = 1
+            while start < end and lines[start] == "":
+                start += 1
+            self.Lines = (lines[0],) + tuple(lines[start:end])
 
     # PyBase.set_annotations():
     def set_annotations(self, anchor_prefix: str, number_prefix: str) -> None:
@@ -123,10 +151,35 @@ class PyBase(object):
         * *number_prefix* (str):
           The string to prepend to the document element name before setting the Number attribute.
 
+        The whole tree below this element is annotated with an explicit work stack rather than
+        by recursion.  Sub-classes implement *annotate_self*() to do the per element work.
+
+        """
+        stack: List[Tuple[PyBase, str, str]] = [(self, anchor_prefix, number_prefix)]
+        py_base: PyBase
+        while stack:
+            py_base, anchor_prefix, number_prefix = stack.pop()
+            stack.extend(py_base.annotate_self(anchor_prefix, number_prefix))
+
+    # PyBase.annotate_self():
+    def annotate_self(self, anchor_prefix: str,
+                      number_prefix: str) -> "List[Tuple[PyBase, str, str]]":
+        """Set the PyBase Anchor and Number attributes of just this element.
+
+        Arguments:
+        * *anchor_prefix* (str):
+          The string to prepend to the document element name before setting the Anchor attribute.
+        * *number_prefix* (str):
+          The string to prepend to the document element name before setting the Number attribute.
+
+        Returns:
+        * (List[Tuple[PyBase, str, str]]):
+          The child elements to annotate next, each with its anchor and number prefixes.
+
         This method must be implemented by sub-classes.
 
         """
-        raise NotImplementedError(f"{self}.set_annotations() is not implemented.")
+        raise NotImplementedError(f"{self}.annotate_self() is not implemented.")
 
 
 # PyFunction:
@@ -139,74 +192,159 @@ class PyFunction(PyBase):
     * *Lines* (Tuple[str, ...])
     * *Anchor* (str)
     * *Number* (str)
+    * *Summary* (str)
 
     Attributes:
-    *  *Function* (Callable): The actual function/method object.
+    *  *Function* (Optional[Callable]):
+       The actual function/method object.  None when extracted from source by *from_ast*().
+    *  *Signature* (str): The function/method signature (computed once from *Function*.)
 
     Constructor:
-    * PyFunction(Name, Lines, Anchor, Number, Function)
+    * PyFunction(Function)
+    * PyFunction.from_ast(node)
 
     """
 
-    Function: Callable
+    Function: Optional[Callable]
+    Signature: str = field(init=False, repr=False, default="")
 
     # PyFunction.__post_init__():
     def __post_init__(self) -> None:
         """Post process a PyFunction."""
-        function: Callable = self.Function
-        if hasattr(function, "__name__"):
-            self.Name = getattr(function, "__name__")
-        if hasattr(function, "__doc__"):
-            self.set_lines(getattr(function, "__doc__"))
+        function: Optional[Callable] = self.Function
+        if function is not None:  # *from_ast*() fills in the attributes itself.
+            self.Name = getattr(function, "__name__", self.Name)
+            self.set_lines(getattr(function, "__doc__", None))
+            self.Signature = PyFunction.callable_signature(function)
 
-    # PyFunction.set_annotations():
-    def set_annotations(self, anchor_prefix: str, number_prefix: str) -> None:
-        """Set the markdown annotations.
+    # PyFunction.from_ast():
+    @classmethod
+    def from_ast(cls, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> "PyFunction":
+        """Return a PyFunction extracted from a parsed function definition.
+
+        Arguments:
+        * *node* (Union[ast.FunctionDef, ast.AsyncFunctionDef]): The parsed function.
 
-        (see [ModeDoc.set_annoations](#Doc-PyBase-set_annotations)
+        Returns:
+        * (PyFunction): The PyFunction with its Name, Lines, and Signature set.
 
         """
-        self.Anchor = anchor_prefix + self.Name.lower().replace("_", "-")
-        self.Number = number_prefix
+        py_function: PyFunction = cls(None)
+        py_function.Name = node.name
+        py_function.set_lines(ast.get_docstring(node, clean=False))
+        py_function.Signature = PyFunction.ast_signature(node)
+        return py_function
 
-    # PyFunction.summary_lines():
-    def summary_lines(self, class_name: str, indent: str) -> Tuple[str, ...]:
-        """Return PyModule table of contents summary lines.
+    # PyFunction.callable_signature():
+    @staticmethod
+    def callable_signature(function: Callable) -> str:
+        """Return the signature of a function object.
 
         Arguments:
-        * *class_name*: The class name the function is a member of.
-        * *indent* (int) The prefix spaces to make the markdown work.
+        * *function* (Callable): The function or method to describe.
 
         Returns:
-        * (Tuple[str, ...]): The resulting summary lines.
+        * (str):
+          The interned `str(inspect.Signature)` of *function*.  JIT compiled wrappers that
+          keep the original function in a `py_func` attribute (e.g. Numba) are unwrapped
+          first, as are `functools.wraps` decorators.  `(...)` is returned when no signature
+          is available (e.g. some builtins.)
 
         """
-        assert self.Lines, f"{class_name=}"
-        return (f"{indent}* {self.Number} [{self.Name}()]"
-                f"(#{self.Anchor}): {self.Lines[0]}",)
+        target: Callable = getattr(function, "py_func", function)
+        try:
+            return sys.intern(str(inspect.signature(target)))
+        except (TypeError, ValueError):  # pragma: no unit cover
+            return "(...)"
 
-    # PyFunction.documentation_lines():
-    def documentation_lines(self, class_name: str, prefix: str) -> Tuple[str, ...]:
-        """Return the PyModule documentation lines.
+    # PyFunction.ast_signature():
+    @staticmethod
+    def ast_signature(node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> str:
+        """Return the signature of a parsed function.
 
         Arguments:
-        * *class_Name* (str): The class name to use for methods.
-        * *prefix* (str): The prefix to use to make the markdown work.
+        * *node* (Union[ast.FunctionDef, ast.AsyncFunctionDef]): The parsed function.
 
         Returns:
-        * (Tuple[str, ...]): The resulting documentations lines
+        * (str):
+          The signature in the same format as `str(inspect.Signature)`, except that annotations
+          and default values are shown as they are written in the source.  The string is
+          interned, so that identical signatures (e.g. `(self)`) share a single string object.
+
+        """
+        def parameter(argument: ast.arg, default: Optional[ast.expr], prefix: str = "") -> str:
+            """Return one formatted parameter."""
+            text: str = prefix + argument.arg
+            if argument.annotation:
+                text += ": " + ast.unparse(argument.annotation)
+                if default:
+                    text += " = " + ast.unparse(default)
+            elif default:
+                text += "=" + ast.unparse(default)
+            return text
+
+        arguments: ast.arguments = node.args
+        positional: List[ast.arg] = arguments.posonlyargs + arguments.args
+        defaults: List[Optional[ast.expr]] = [None] * (len(positional) - len(arguments.defaults))
+        defaults.extend(arguments.defaults)
+        parameters: List[str] = []
+        index: int
+        argument: ast.arg
+        default: Optional[ast.expr]
+        for index, (argument, default) in enumerate(zip(positional, defaults)):
+            parameters.append(parameter(argument, default))
+            if index + 1 == len(arguments.posonlyargs):
+                parameters.append("/")
+        if arguments.vararg:
+            parameters.append(parameter(arguments.vararg, None, "*"))
+        elif arguments.kwonlyargs:
+            parameters.append("*")
+        for argument, default in zip(arguments.kwonlyargs, arguments.kw_defaults):
+            parameters.append(parameter(argument, default))
+        if arguments.kwarg:
+            parameters.append(parameter(arguments.kwarg, None, "**"))
+
+        signature: str = f"({', '.join(parameters)})"
+        if node.returns:
+            signature += " -> " + ast.unparse(node.returns)
+        return sys.intern(signature)
+
+    # PyFunction.annotate_self():
+    def annotate_self(self, anchor_prefix: str,
+                      number_prefix: str) -> List[Tuple[PyBase, str, str]]:
+        """Set the markdown annotations.
+
+        (see [ModeDoc.annotate_self](#Doc-PyBase-annotate_self)
+
+        """
+        self.Anchor = anchor_prefix + self.Name.translate(_ANCHOR_TABLE)
+        self.Number = number_prefix
+        self.Summary = f"* {number_prefix} [{self.Name}()](#{self.Anchor}): {self.Lines[0]}"
+        return []
+
+    # PyFunction.emit_lines():
+    def emit_lines(self, class_name: str, indent: str, prefix: str,
+                   summary_lines: List[str], documentation_lines: List[str]) -> None:
+        """Append the PyFunction table of contents and documentation lines.
+
+        Arguments:
+        * *class_name* (str): The class name the function is a member of.
+        * *indent* (str): The prefix spaces to make the table of contents markdown work.
+        * *prefix* (str): The heading prefix to make the documentation markdown work.
+        * *summary_lines* (List[str]): The list to append the table of contents lines to.
+        * *documentation_lines* (List[str]): The list to append the documentation lines to.
 
         """
-        lines: Tuple[str, ...] = self.Lines
-        signature: inspect.Signature = inspect.Signature.from_callable(self.Function)
-        doc_lines: Tuple[str, ...] = (
-            (f"{prefix} <a name=\"{self.Anchor}\"></a>{self.Number} "
-             f"`{class_name}.`{self.Name}():"),
-            "",
-            f"{class_name}.{self.Name}{signature}:",
-            ""
-        ) + lines + ("",)
-        return doc_lines
+        assert self.Lines, f"{class_name=}"
+        summary_lines.append(indent + self.Summary)
+
+        documentation_lines.append(f"{prefix} <a name=\"{self.Anchor}\"></a>{self.Number} "
+                                   f"`{class_name}.`{self.Name}():")
+        documentation_lines.append("")
+        documentation_lines.append(f"{class_name}.{self.Name}{self.Signature}:")
+        documentation_lines.append("")
+        documentation_lines.extend(self.Lines)
+        documentation_lines.append("")
 
 
 # PyClass:
@@ -216,14 +354,17 @@ class PyClass(PyBase):
 
     Inherited Attributes:
     * *Name* (str): The attribute name.
-    * *Lines* ( , *Anchor*, *Number* from PyBase.
+    * *Lines* ( , *Anchor*, *Number*, *Summary* from PyBase.
 
     Attributes:
-    * *Class* (Any): The underlying Python class object that is imported.
+    * *Class* (Any):
+      The underlying Python class object that is imported.  None when extracted from source
+      by *from_ast*().
     * *Functions* (Tuple[PyFunction, ...]): The various functions associated with the Class.
 
     Constructor:
-    * PyClass()
+    * PyClass(Class)
+    * PyClass.from_ast(node)
 
     """
 
@@ -233,66 +374,182 @@ class PyClass(PyBase):
     # PyClass.__post_init__():
     def __post_init__(self) -> None:
         """Post process PyClass."""
+        if self.Class is None:
+            return  # *from_ast*() fills in the attributes itself.
+
         # Set Name and Lines attributes:
-        if hasattr(self.Class, "__name__"):
-            self.Name = cast(str, getattr(self.Class, "__name__"))
-        if hasattr(self.Class, "__doc__"):
-            self.set_lines(cast(str, getattr(self.Class, "__doc__")))
+        self.Name = cast(str, getattr(self.Class, "__name__", self.Name))
+        self.set_lines(cast(Optional[str], getattr(self.Class, "__doc__", None)))
 
-        # Set the Functions attribute:
+        # Set the Functions attribute.  Only the class dictionary is scanned, so inherited methods
+        # are skipped; callables that were defined in some other module are skipped as well:
         py_functions: List[PyFunction] = []
+        class_module: Optional[str] = getattr(self.Class, "__module__", None)
         attribute_name: str
         attribute: Any
         for attribute_name, attribute in self.Class.__dict__.items():
-            if not attribute_name.startswith("_") and callable(attribute):
+            if (not attribute_name.startswith("_") and callable(attribute)
+                    and getattr(attribute, "__module__", None) == class_module):
                 py_functions.append(PyFunction(attribute))
         self.Functions = tuple(py_functions)
 
-    # PyClass.set_annotations():
-    def set_annotations(self, anchor_prefix: str, number_prefix: str) -> None:
+    # PyClass.from_ast():
+    @classmethod
+    def from_ast(cls, node: ast.ClassDef) -> "PyClass":
+        """Return a PyClass extracted from a parsed class definition.
+
+        Arguments:
+        * *node* (ast.ClassDef): The parsed class.
+
+        Returns:
+        * (PyClass): The PyClass with its Name, Lines and Functions set.
+
+        Only the public methods defined directly in the class body are extracted.  Properties
+        are attributes rather than methods, so they are skipped just like the imported class
+        path skips them.
+
+        """
+        py_class: PyClass = cls(None)
+        py_class.Name = node.name
+        py_class.set_lines(ast.get_docstring(node, clean=False))
+
+        py_functions: List[PyFunction] = []
+        statement: ast.stmt
+        for statement in node.body:
+            if (isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef))
+                    and not statement.name.startswith("_")
+                    and not any(PyClass.is_property_decorator(decorator)
+                                for decorator in statement.decorator_list)):
+                py_functions.append(PyFunction.from_ast(statement))
+        py_class.Functions = tuple(py_functions)
+        return py_class
+
+    # PyClass.is_property_decorator():
+    @staticmethod
+    def is_property_decorator(decorator: ast.expr) -> bool:
+        """Return True if a parsed decorator turns a method into a property.
+
+        Arguments:
+        * *decorator* (ast.expr): The parsed decorator expression.
+
+        Returns:
+        * (bool):
+          True for `@property`, `@functools.cached_property` and the `@NAME.setter` style
+          decorators, and False otherwise.
+
+        """
+        if isinstance(decorator, ast.Name):
+            return decorator.id in ("property", "cached_property")
+        if isinstance(decorator, ast.Attribute):
+            return decorator.attr in ("cached_property", "getter", "setter", "deleter")
+        return False
+
+    # PyClass.annotate_self():
+    def annotate_self(self, anchor_prefix: str,
+                      number_prefix: str) -> List[Tuple[PyBase, str, str]]:
         """Set the Markdown anchor."""
-        anchor: str = anchor_prefix + self.Name.lower().replace("_", "-")
+        anchor: str = anchor_prefix + self.Name.translate(_ANCHOR_TABLE)
         self.Anchor = anchor
         self.Number = number_prefix
+        self.Summary = f"* {number_prefix} Class: [{self.Name}](#{anchor}):"
 
         next_anchor_prefix: str = anchor_prefix + "--"
-        py_function: PyFunction
-        for index, py_function in enumerate(self.Functions):
-            py_function.set_annotations(next_anchor_prefix, f"{number_prefix}.{index + 1}")
-
-    # PyClass.summary_lines():
-    def summary_lines(self, indent: str) -> Tuple[str, ...]:
-        """Return PyModule summary lines."""
-        lines: List[str] = [
-            f"{indent}* {self.Number} Class: [{self.Name}](#{self.Anchor}):"]
+        return [(py_function, next_anchor_prefix, f"{number_prefix}.{index + 1}")
+                for index, py_function in enumerate(self.Functions)]
+
+    # PyClass.emit_lines():
+    def emit_lines(self, indent: str, prefix: str,
+                   summary_lines: List[str], documentation_lines: List[str]) -> None:
+        """Append the PyClass table of contents and documentation lines.
+
+        Arguments:
+        * *indent* (str): The prefix spaces to make the table of contents markdown work.
+        * *prefix* (str): The heading prefix to make the documentation markdown work.
+        * *summary_lines* (List[str]): The list to append the table of contents lines to.
+        * *documentation_lines* (List[str]): The list to append the documentation lines to.
+
+        Both lists are filled in during a single walk over the class functions.
+
+        """
+        summary_lines.append(indent + self.Summary)
+        documentation_lines.append(
+            f"{prefix} <a name=\"{self.Anchor}\"></a>{self.Number} Class {self.Name}:")
+        documentation_lines.append("")
+        documentation_lines.extend(self.Lines)
+        documentation_lines.append("")
+
         next_indent: str = indent + "  "
+        next_prefix: str = prefix + "#"
         py_function: PyFunction
         for py_function in self.Functions:
-            lines.extend(py_function.summary_lines(self.Name, next_indent))
-        return tuple(lines)
-
-    # PyClass.documentation_lines():
-    def documentation_lines(self, prefix: str) -> Tuple[str, ...]:
-        """Return the PyModule documentation lines."""
-        lines: Tuple[str, ...] = self.Lines
-        doc_lines: List[str] = [
-            f"{prefix} <a name=\"{self.Anchor}\"></a>{self.Number} Class {self.Name}:",
-            "",
-        ]
-        doc_lines.extend(lines)
-        doc_lines.append("")
-        next_prefix: str = prefix + "#"
-        function: PyFunction
-        for function in self.Functions:
-            doc_lines.extend(function.documentation_lines(self.Name, next_prefix))
-        doc_lines.append("")
-        return tuple(doc_lines)
+            py_function.emit_lines(
+                self.Name, next_indent, next_prefix, summary_lines, documentation_lines)
+        documentation_lines.append("")
+
+
+# HtmlConversion:
+@dataclass
+class HtmlConversion:
+    """HtmlConversion: A pending markdown to HTML conversion by an external program.
+
+    Attributes:
+    * *markdown_program* (str):
+      The program that reads markdown from its standard input and writes HTML to its standard
+      output.
+    * *markdown_bytes* (bytes):
+      The UTF-8 encoded markdown text to convert.
+    * *html_path* (Path):
+      The HTML (`.html`) file to write the converted output into.
+
+    Constructor:
+    * HtmlConversion(markdown_program, markdown_bytes, html_path)
+
+    """
+
+    markdown_program: str
+    markdown_bytes: bytes = field(repr=False)
+    html_path: Path
+
+    # HtmlConversion.run():
+    def run(self) -> Optional[str]:
+        """Run the markdown program to generate the HTML file.
+
+        Returns:
+        * (Optional[str]): An error message if the conversion failed and None otherwise.
+
+        Each HtmlConversion runs its program in a separate process, so *Arguments.process_all*()
+        runs them concurrently on a pool of threads.
+
+        """
+        import subprocess
+
+        # The program writes its HTML straight into *html_path* rather than through a pipe:
+        try:
+            html_file: IO[bytes]
+            with open(self.html_path, "wb") as html_file:
+                subprocess.run((self.markdown_program,), input=self.markdown_bytes,
+                               stdout=html_file, stderr=subprocess.DEVNULL, check=False)
+        except OSError as os_error:  # pragma: no unit cover
+            self.html_path.unlink(missing_ok=True)
+            return f"{self.html_path}: Unable to run {self.markdown_program}: {os_error}"
+        return None
 
 
 # PyModule:
 @dataclass
 class PyModule(PyBase):
-    """PyModule: Represents a module."""
+    """PyModule: Represents a module.
+
+    Attributes:
+    * *Module* (Any):
+      The imported module object.  None when extracted from source by *from_ast*().
+    * *Classes* (Tuple[PyClass, ...]): The classes defined in the module in alphabetical order.
+
+    Constructor:
+    * PyModule(Module)
+    * PyModule.from_ast(tree, module_name)
+
+    """
 
     Module: Any = field(repr=False)
     Classes: Tuple[PyClass, ...] = field(init=False, default=())
@@ -301,110 +558,168 @@ class PyModule(PyBase):
     def __post_init__(self) -> None:
         """Recursively extract information from an object."""
         module: Any = self.Module
+        if module is None:
+            return  # *from_ast*() fills in the attributes itself.
 
         # Get initial *module_name*:
-        module_name: str = ""
-        if hasattr(module, "__name__"):
-            module_name = getattr(module, "__name__")
-        is_package: bool = module_name == "__init__"
-
-        tracing: str = "" if is_package else ""  # Change first string to enable package tracing.
-        if tracing:
-            print(f"{tracing}Processing {module_name} {is_package=}")
-        if hasattr(module, "__doc__"):
-            doc_string = getattr(module, "__doc__")
-            if tracing:
-                print(f"{tracing}{doc_string=}")
-            self.set_lines(doc_string)
-            if is_package:
-                first_line: str = self.Lines[0]
-                colon_index: int = first_line.find(":")
-                if colon_index >= 0:
-                    module_name = first_line[:colon_index]
-                    first_line = first_line[colon_index + 2:]  # Skip over "...: "
-                    self.Lines = (first_line,) + self.Lines[1:]
+        module_name: str = self.set_name_and_lines(
+            getattr(module, "__name__", ""), getattr(module, "__doc__", None))
 
         # The Python import statement can import class to the module namespace.
         # We are only interested in classes that are defined in *module*:
         py_classes: List[PyClass] = []
-        class_type: type = type(PyBase)  # Any class name to get the associated class type.
-        assert isinstance(class_type, type)
         attribute_name: str
+        attribute: Any
         # print(f"{module=} {type(module)=}")
-        for attribute_name in dir(module):
-            if not attribute_name.startswith("_"):
-                attribute: Any = getattr(module, attribute_name)
-                if hasattr(attribute, "__module__"):
-                    defining_module: Any = getattr(attribute, "__module__")
-                    # print(f"{attribute_name=} {attribute=} {defining_module}")
-                    if isinstance(attribute, class_type) and str(defining_module) == module_name:
-                        py_classes.append(PyClass(attribute))
-                        # print(f">>>>>>>>>>Defined class: {attribute_name}")
-        self.Name = module_name
+        # Read the module dictionary directly rather than using `dir()` followed by `getattr()`.
+        # Only the defined classes are sorted so that the table of contents stays in alphabetical
+        # order; there is no point in sorting all of the other module attributes as well:
+        defined_classes: Dict[str, Any] = {}
+        for attribute_name, attribute in vars(module).items():
+            if not attribute_name.startswith("_") and inspect.isclass(attribute):
+                defining_module: Any = getattr(attribute, "__module__", None)
+                # print(f"{attribute_name=} {attribute=} {defining_module}")
+                # Module names are normally interned, so the identity test almost always decides:
+                if defining_module is module_name or defining_module == module_name:
+                    defined_classes[attribute_name] = attribute
+                    # print(f">>>>>>>>>>Defined class: {attribute_name}")
+        for attribute_name in sorted(defined_classes):
+            py_classes.append(PyClass(defined_classes[attribute_name]))
         self.Classes = tuple(py_classes)
 
-    # PyModule.set_annotations():
-    def set_annotations(self, anchor_prefix: str, number_prefix: str) -> None:
+    # PyModule.from_ast():
+    @classmethod
+    def from_ast(cls, tree: ast.Module, module_name: str) -> "PyModule":
+        """Return a PyModule extracted from a parsed Python file.
+
+        Arguments:
+        * *tree* (ast.Module): The parsed Python file.
+        * *module_name* (str): The module name (i.e. the file name without the `.py` suffix.)
+
+        Returns:
+        * (PyModule): The PyModule with its Name, Lines and Classes set.
+
+        Nothing is imported, so none of the module code is run.  The public classes defined at
+        the top level of the module are extracted in alphabetical order.
+
+        """
+        py_module: PyModule = cls(None)
+        py_module.set_name_and_lines(module_name, ast.get_docstring(tree, clean=False))
+        class_nodes: Dict[str, ast.ClassDef] = {
+            statement.name: statement for statement in tree.body
+            if isinstance(statement, ast.ClassDef) and not statement.name.startswith("_")}
+        class_name: str
+        py_module.Classes = tuple(
+            PyClass.from_ast(class_nodes[class_name]) for class_name in sorted(class_nodes))
+        return py_module
+
+    # PyModule.set_name_and_lines():
+    def set_name_and_lines(self, module_name: str, doc_string: Optional[str]) -> str:
+        """Set the Name and Lines attributes of a PyModule.
+
+        Arguments:
+        * *module_name* (str): The module name.  `__init__` for a package.
+        * *doc_string* (Optional[str]): The module doc string or None if there is none.
+
+        Returns:
+        * (str): The module name that was stored in the Name attribute.
+
+        A package (`__init__`) takes its name from the `NAME: ` prefix of its doc string.
+
+        """
+        is_package: bool = module_name == "__init__"
+        tracing: str = "" if is_package else ""  # Change first string to enable package tracing.
+        if tracing:
+            print(f"{tracing}Processing {module_name} {is_package=}")
+            print(f"{tracing}{doc_string=}")
+        self.set_lines(doc_string)
+        if is_package:
+            first_line: str = self.Lines[0]
+            colon_index: int = first_line.find(":")
+            if colon_index >= 0:
+                module_name = first_line[:colon_index]
+                first_line = first_line[colon_index + 2:]  # Skip over "...: "
+                self.Lines = (first_line,) + self.Lines[1:]
+        self.Name = module_name
+        return module_name
+
+    # PyModule.annotate_self():
+    def annotate_self(self, anchor_prefix: str,
+                      number_prefix: str) -> List[Tuple[PyBase, str, str]]:
         """Set the Markdown anchor."""
-        anchor: str = anchor_prefix + self.Name.lower().replace("_", "-")
+        anchor: str = anchor_prefix + self.Name.translate(_ANCHOR_TABLE)
         self.Anchor = anchor
 
         next_anchor_prefix: str = anchor + "--"
-        py_class: PyClass
-        index: int
-        for index, py_class in enumerate(self.Classes):
-            py_class.set_annotations(next_anchor_prefix, f"{index + 1}")
+        return [(py_class, next_anchor_prefix, f"{index + 1}")
+                for index, py_class in enumerate(self.Classes)]
 
-    # PyModule.summary_lines():
-    def summary_lines(self) -> Tuple[str, ...]:
-        """Return PyModule summary lines."""
+    # PyModule.emit_lines():
+    def emit_lines(self, prefix: str,
+                   summary_lines: List[str], documentation_lines: List[str]) -> None:
+        """Append the PyModule summary and documentation lines.
+
+        Arguments:
+        * *prefix* (str): The heading prefix to make the documentation markdown work.
+        * *summary_lines* (List[str]):
+          The list to append the module title, description and table of contents to.
+        * *documentation_lines* (List[str]): The list to append the class documentation to.
+
+        Both lists are filled in during a single walk over the module classes.
+
+        """
         # Create the Title
-        lines: List[str] = []
-        if self.Name == "__init__":
+        is_package: bool = self.Name == "__init__"
+        class_summary_lines: List[str] = summary_lines
+        if is_package:
             # Package is the top level doc string only.
-            lines.extend(self.Lines)  # pragma: no unit cover
+            summary_lines.extend(self.Lines)  # pragma: no unit cover
+            class_summary_lines = []  # pragma: no unit cover
         else:
-            lines.append(f"# {self.Name}: {self.Lines[0]}")
-            lines.extend(self.Lines[1:])
-            lines.append("")
+            summary_lines.append(f"# {self.Name}: {self.Lines[0]}")
+            summary_lines.extend(self.Lines[1:])
+            summary_lines.append("")
             if self.Classes:
-                lines.append("## Table of Contents (alphabetical order):")
-                lines.append("")
-
-            # Fill in the rest of the table of contents:
-            py_class: PyClass
-            next_indent: str = ""
-            for py_class in self.Classes:
-                lines.extend(py_class.summary_lines(next_indent))
-            lines.append("")
-        return tuple(lines)
-
-    # PyModule.documentation_lines():
-    def documentation_lines(self, prefix: str) -> Tuple[str, ...]:
-        """Return the PyModule documentation lines."""
-        # lines: Tuple[str, ...]  = self.Lines
-        # doc_lines: List[str] = [f"{prefix} <a name=\"{self.Anchor}\"></a>{lines[0]}", ""]
-        # doc_lines.extend(lines[1:])
-
-        doc_lines: List[str] = []
-        next_prefix: str = prefix + "#"
+                summary_lines.append("## Table of Contents (alphabetical order):")
+                summary_lines.append("")
+
+        # Fill in the rest of the table of contents and the class documentation:
         py_class: PyClass
+        next_indent: str = ""
+        next_prefix: str = prefix + "#"
         for py_class in self.Classes:
-            doc_lines.extend(py_class.documentation_lines(next_prefix))
-        doc_lines.append("")
-        return tuple(doc_lines)
+            py_class.emit_lines(next_indent, next_prefix, class_summary_lines, documentation_lines)
+        if not is_package:
+            summary_lines.append("")
+        documentation_lines.append("")
 
     # PyModule.generate():
-    def generate(self, markdown_path: Path, markdown_program: str, tracing: str = "") -> None:
-        """Generate the markdown and HTML files."""
+    def generate(self, markdown_path: Path, markdown_program: str,
+                 markdown_renderer: Optional[Callable[[str], str]] = None,
+                 conversions: Optional[List[HtmlConversion]] = None,
+                 tracing: str = "") -> None:
+        """Generate the markdown and HTML files.
+
+        Arguments:
+        * *markdown_path* (Path): The markdown (`.md`) file to write.
+        * *markdown_program* (str):
+          The program to convert the markdown file into an HTML file.  Empty for none.
+        * *markdown_renderer* (Optional[Callable[[str], str]]):
+          An in-process markdown to HTML converter.  When present, it is used instead of
+          *markdown_program*.  (Default: None)
+        * *conversions* (Optional[List[HtmlConversion]]):
+          When present, the *markdown_program* HTML conversion is appended to this list rather
+          than being run immediately, so that the caller can run them all concurrently.
+          (Default: None)
+
+        """
         # Compute *markdown_lines*:
         # next_tracing: str = tracing + " " if tracing else ""
         if tracing:
             print(f"{tracing}=>PyModule.generate({markdown_path}, {markdown_program})")
-        module_summary_lines: Tuple[str, ...] = self.summary_lines()
-        module_documentation_lines: Tuple[str, ...] = self.documentation_lines("#")
-        markdown_lines: Tuple[str, ...] = (
-            module_summary_lines + module_documentation_lines + ("",))
+        markdown_lines: List[str] = []
+        documentation_lines: List[str] = []
+        self.emit_lines("#", markdown_lines, documentation_lines)
 
         # Make sure that the *docs_directory* actually exists:
         docs_directory: Path = markdown_path.parent
@@ -414,34 +729,172 @@ class PyModule(PyBase):
             docs_directory.mkdir(parents=True, exist_ok=True)  # pragma: no unit cover
 
         # Write *markdown_lines* out to *markdown_path* file:
-        try:
-            markdown_file: IO[str]
+        # The markdown is written to *temporary_path* and then renamed over *markdown_path*, so a
+        # reader never sees a partially written file.  The process id keeps worker processes that
+        # write the same file from sharing a temporary file, and a failed write removes it:
+        if tracing:
+            print(f"{tracing}Writing out {markdown_path}")
+        temporary_path: Path = markdown_path.with_name(f"{markdown_path.name}.{os.getpid()}.tmp")
+        if not markdown_renderer and not markdown_program:
+            # Without an HTML conversion the full text is never needed, so the lines are streamed
+            # straight into the file without building it:
+            try:
+                markdown_file: IO[str]
+                with open(temporary_path, "w", encoding="utf-8",
+                          buffering=_WRITE_BUFFER_SIZE) as markdown_file:
+                    markdown_file.writelines(
+                        f"{line}\n" for line in itertools.chain(markdown_lines,
+                                                                 documentation_lines))
+                os.replace(temporary_path, markdown_path)
+            except IOError:  # pragma: no unit cover
+                temporary_path.unlink(missing_ok=True)
+                raise RuntimeError(f"Unable to write to {markdown_path}")
             if tracing:
-                print(f"{tracing}Writing out {markdown_path}")
-            # FIXME: Gross hack!!!
-            with open("README.md", "w") as markdown_file:
-                markdown_file.write("\n".join(markdown_lines))
-        except IOError:  # pragma: no unit covert
+                print(f"{tracing}<=PyModule.generate({markdown_path}, {markdown_program})")
+            return
+
+        # The text is joined and encoded exactly once; the same bytes are written to the markdown
+        # file and fed to *markdown_program*:
+        markdown_lines.extend(documentation_lines)
+        markdown_lines.append("")
+        markdown_text: str = "\n".join(markdown_lines)
+        markdown_bytes: bytes = markdown_text.encode("utf-8")
+        try:
+            temporary_path.write_bytes(markdown_bytes)
+            os.replace(temporary_path, markdown_path)
+        except IOError:  # pragma: no unit cover
+            temporary_path.unlink(missing_ok=True)
             raise RuntimeError(f"Unable to write to {markdown_path}")
 
-        # Run *markdown_program*:
-        if markdown_program:
-            html_path: Path = markdown_path.with_suffix(".html")
-            arguments: Tuple[str, ...] = (
-                markdown_program, str(markdown_path))
+        # Convert to HTML in-process if possible, otherwise run *markdown_program*:
+        html_path: Path = markdown_path.with_suffix(".html")
+        if markdown_renderer:
             if tracing:
-                print(f"{tracing}{arguments=}")
-            html_file: IO[bytes]
-            with open(html_path, "wb") as html_file:
-                result: subprocess.CompletedProcess
-                result = subprocess.run(arguments, capture_output=True)
-                output: bytes = result.stdout
-                assert isinstance(output, bytes)
-                html_file.write(output)
+                print(f"{tracing}Rendering {html_path}")
+            try:
+                html_path.write_text(markdown_renderer(markdown_text), encoding="utf-8")
+            except IOError:  # pragma: no unit cover
+                raise RuntimeError(f"Unable to write to {html_path}")
+        elif markdown_program:
+            conversion: HtmlConversion = HtmlConversion(
+                markdown_program, markdown_bytes, html_path)
+            if tracing:
+                print(f"{tracing}{conversion=}")
+            if conversions is None:
+                error: Optional[str] = conversion.run()
+                if error:
+                    raise RuntimeError(error)  # pragma: no unit cover
+            else:
+                conversions.append(conversion)
         if tracing:
             print(f"{tracing}<=PyModule.generate({markdown_path}, {markdown_program})")
 
 
+# BuildCache:
+@dataclass
+class BuildCache:
+    """BuildCache: Remembers which Python files already have up to date markdown and HTML files.
+
+    Attributes:
+    * *cache_path* (Path):
+      The JSON file that the cache is loaded from and saved to.
+    * *entries* (Dict[str, List[Any]]):
+      Maps a Python file path to its `[source_key, md_mtime_ns, html_mtime_ns]` entry.
+    * *pending* (Dict[str, Tuple[str, Path, Path]]):
+      Maps a Python file path to its `(source_key, md_path, html_path)` for the files that
+      have been regenerated during this run, but are not yet recorded in *entries*.
+    * *generator_key* (bytes):
+      A hash of this program, so that changes to it invalidate the whole cache.
+
+    Constructor:
+    * BuildCache(cache_path)
+
+    """
+
+    cache_path: Path
+    entries: Dict[str, List[Any]] = field(init=False, repr=False)
+    pending: Dict[str, Tuple[str, Path, Path]] = field(init=False, repr=False)
+    generator_key: bytes = field(init=False, repr=False)
+
+    # BuildCache.__post_init__():
+    def __post_init__(self) -> None:
+        """Load the BuildCache entries if the cache file is present."""
+        self.entries = {}
+        self.pending = {}
+        self.generator_key = hashlib.blake2b(Path(__file__).read_bytes()).digest()
+        try:
+            entries: Any = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(entries, dict):
+            self.entries = entries
+
+    # BuildCache.source_key():
+    def source_key(self, python_file: "PyFile") -> str:
+        """Return the hash key for a PyFile.
+
+        Arguments:
+        * *python_file* (PyFile): The Python file to compute the key for.
+
+        Returns:
+        * (str): A hash of this program, the Python source, and the output settings.
+
+        """
+        hasher: Any = hashlib.blake2b(self.generator_key)
+        hasher.update(python_file.source)
+        hasher.update(f"\0{python_file.md_path}\0{python_file.markdown_program}".encode())
+        hasher.update(b"\0" if python_file.markdown_renderer else b"\1")
+        return hasher.hexdigest()
+
+    # BuildCache.is_current():
+    def is_current(self, python_file: "PyFile") -> bool:
+        """Return True if the generated files for a PyFile are up to date.
+
+        Arguments:
+        * *python_file* (PyFile): The Python file to check.
+
+        Returns:
+        * (bool): True if neither the Python file nor its generated files have changed.
+
+        When the PyFile is not current, it is remembered as pending so that *save*() can
+        record it once its files have been generated.
+
+        """
+        py_key: str = str(python_file.py_path)
+        source_key: str = self.source_key(python_file)
+        entry: Optional[List[Any]] = self.entries.get(py_key)
+        if entry == [source_key, BuildCache.mtime(python_file.md_path),
+                     BuildCache.mtime(python_file.html_path)] and entry[1] is not None:
+            return True
+        self.pending[py_key] = (source_key, python_file.md_path, python_file.html_path)
+        return False
+
+    # BuildCache.mtime():
+    @staticmethod
+    def mtime(path: Path) -> Optional[int]:
+        """Return the modification time of a file in nanoseconds or None if it does not exist."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    # BuildCache.save():
+    def save(self) -> None:
+        """Record the pending PyFiles and write the cache out to its JSON file."""
+        py_key: str
+        source_key: str
+        md_path: Path
+        html_path: Path
+        for py_key, (source_key, md_path, html_path) in self.pending.items():
+            self.entries[py_key] = [
+                source_key, BuildCache.mtime(md_path), BuildCache.mtime(html_path)]
+        self.pending = {}
+        try:
+            self.cache_path.write_text(json.dumps(self.entries, indent=1, sort_keys=True))
+        except OSError:  # pragma: no unit cover
+            pass  # The cache is only an optimization.
+
+
 # PyFile:
 @dataclass
 class PyFile:
@@ -457,14 +910,21 @@ class PyFile:
     * *markdown_program* (Optional[str]):
       The path to the program that coverts a .md file into a .html file.
       Defaults to None, if no converter is present.
+    * *markdown_renderer* (Optional[Callable[[str], str]]):
+      An in-process markdown to HTML converter that is preferred over *markdown_program*.
+      (Default is None.)
     * *detects_main* (bool):
-      True if either `if __name__ == "__main__:"` or `if __name__ == '__main__:` is present in file.
-      (Default is False.)
+      True if a top level `if __name__ == "__main__":` is present in file.  It is filled in
+      by *process*().  (Default is False.)
     * has_main: (bool):
-      True if `def main(` is present in file.  (Default is False.)
+      True if a top level `def main(...)` is present in file.  It is filled in by *process*().
+      (Default is False.)
+    * *source* (bytes):
+      The contents of the Python file.  It is read once and shared by everything that needs it.
+      (Empty if the file can not be read.)
 
     Constructor:
-    * PyFile(py_path, md_path, html_path, markdown_convert)
+    * PyFile(py_path, md_path, html_path, markdown_convert, markdown_renderer)
 
     """
 
@@ -472,64 +932,97 @@ class PyFile:
     md_path: Path
     html_path: Path
     markdown_program: Optional[str]
+    markdown_renderer: Optional[Callable[[str], str]] = field(default=None, repr=False)
     detects_main: bool = field(init=False)
     has_main: bool = field(init=False)
+    source: bytes = field(init=False, repr=False)
 
     # PyFile.__post_init__():
-    def __post__init__(self) -> None:
-        """Finish initializing a PyFile."""
+    def __post_init__(self) -> None:
+        """Finish initializing a PyFile.
+
+        The Python file is read, but it is not parsed until it is processed.  A file that can
+        not be read leaves *source* empty; the problem is reported when it is processed.
+
+        """
         self.detects_main = False
         self.has_main = False
-        file: IO[str]
-        lines: List[str]
-        with open(self.py_path, "r") as file:
-            lines = "/n".split(file.read())
-        line: str
-        for line in lines:
-            if line.startswith("def main("):
+        self.source = b""
+        try:
+            self.source = self.py_path.read_bytes()
+        except OSError:
+            pass
+
+    # PyFile.find_main():
+    def find_main(self, tree: ast.Module) -> None:
+        """Set the main flags from a parsed Python file.
+
+        Arguments:
+        * *tree* (ast.Module): The parsed Python file.
+
+        Only the top level statements are examined for a `def main(...)` and an
+        `if __name__ == "__main__":`.
+
+        """
+        node: ast.stmt
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and node.name == "main":
                 self.has_main = True
-            elif (line.startswith("if __name__ == ")
-                  and line[-1] == ":" and line[-6:-1] == "__main__"):
-                self.detects_main = True
+            elif isinstance(node, ast.If) and isinstance(node.test, ast.Compare):
+                test: ast.Compare = node.test
+                if (isinstance(test.left, ast.Name) and test.left.id == "__name__"
+                        and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq)
+                        and isinstance(test.comparators[0], ast.Constant)
+                        and test.comparators[0].value == "__main__"):
+                    self.detects_main = True
 
     # PyFile.process():
-    def process(self, modules: "List[PyModule]", errors: List[str], tracing: str = "") -> None:
+    def process(self, conversions: Optional[List[HtmlConversion]] = None,
+                tracing: str = "") -> "Tuple[Optional[PyModule], List[str]]":
         """Process a PyFile.
 
         Arguments:
-        * modules (List[PyModule]): A list to collect all PyModules onto.
-        * errors (List[str]): A list to collect any generated errors on.
+        * conversions (Optional[List[HtmlConversion]]):
+          A list to collect pending HTML conversions on.  If None, they are run immediately.
+
+        Returns:
+        * (Tuple[Optional[PyModule], List[str]]):
+          The generated PyModule (None if the file could not be parsed) and any errors.
 
-        Process the PyFile (*self*) and append the generated PyModule to *modulues*.
-        Any error message lines are append to *error*s.
+        Nothing outside of the PyFile (*self*) is modified, so different PyFile's can be
+        processed in separate processes.  (The main flags are only set on the copy of *self*
+        that is processed.)
 
         """
         next_tracing = tracing + " " if tracing else ""
         module_name: str = f"{self.py_path}"
         if tracing:
             print(f"{tracing}=>PyFile.process({module_name}, *")
+        errors: List[str] = []
 
-        module: Any = None  # TODO: figure out what the real type is.
+        # The documentation is extracted from the parsed source, so the module is never imported
+        # and none of its code (or the code of anything it imports) is run:
         try:
-            module = importlib.import_module(f"{self.py_path.stem}")
-        except ModuleNotFoundError as module_not_found_error:  # pragma: no unit cover
-            errors.append(f"Unable to open module '{module_name}': {str(module_not_found_error)}")
-        except TypeError as type_error:  # pragma: no unit cover
-            errors.append(f"Error with import of module '{module_name}: {str(type_error)}")
-        if module is None:  # pragma: no unit cover
-            errors.append(f"Unable to open module {module_name}: Not clear why")
-
-        py_module: PyModule = PyModule(module)
+            tree: ast.Module = ast.parse(
+                self.source or self.py_path.read_bytes(), str(self.py_path))
+        except (OSError, SyntaxError, ValueError) as error:  # pragma: no unit cover
+            errors.append(f"Unable to parse {module_name}: {error}")
+            return None, errors
+
+        # The same parse is used for both the main flags and the documentation:
+        self.find_main(tree)
+        py_module: PyModule = PyModule.from_ast(tree, self.py_path.stem)
         py_module.set_annotations("", "")
         md_path: Path = self.md_path
         try:
-            py_module.generate(md_path, f"{self.markdown_program}", tracing=next_tracing)
+            py_module.generate(md_path, self.markdown_program or "", self.markdown_renderer,
+                               conversions, tracing=next_tracing)
         except RuntimeError as runtime_error:  # pragma: no unit cover
             errors.append(f"{md_path}: runtime error {runtime_error}")
-        modules.append(py_module)
 
         if tracing:
-            print(f"{tracing}<=PyFile.process({module_name}, *, *")
+            print(f"{tracing}<=PyFile.process({module_name}, *")
+        return py_module, errors
 
 
 # PyPackage:
@@ -554,6 +1047,69 @@ class PyPackage(PyBase):
     Functions: Tuple[PyFunction, ...] = field(init=False, default=())
 
 
+# cached_which():
+@functools.lru_cache(maxsize=None)
+def cached_which(program: str) -> Optional[str]:
+    """Return the full path to an executable program.
+
+    Arguments:
+    * *program* (str): The program to search the `PATH` for.
+
+    Returns:
+    * (Optional[str]): The path to *program* or None if it is not found.
+
+    This is `shutil.which()` with the results remembered, so the `PATH` directories are only
+    searched once per program no matter how many Arguments objects are created.
+
+    """
+    import shutil
+
+    return shutil.which(program)
+
+
+# python_file_names():
+@functools.lru_cache(maxsize=None)
+def python_file_names(directory: str, modified: int) -> Tuple[str, ...]:
+    """Return the names of the Python files in a directory.
+
+    Arguments:
+    * *directory* (str): The absolute path of the directory to scan.
+    * *modified* (int):
+      The `st_mtime_ns` of *directory*.  It is only used as part of the cache key, so that a
+      directory is scanned again after files have been added, removed, or renamed.
+
+    Returns:
+    * (Tuple[str, ...]): The non-hidden `.py` file names in *directory* in scan order.
+
+    One `os.scandir()` pass supplies both the names and the file types, and the results are
+    remembered, so the same directory is only read once per process while it is unchanged.
+
+    """
+    directory_entries: Iterator[os.DirEntry]
+    with os.scandir(directory) as directory_entries:
+        return tuple(directory_entry.name for directory_entry in directory_entries
+                     if directory_entry.name.endswith(".py")
+                     and not directory_entry.name.startswith(".") and directory_entry.is_file())
+
+
+# find_markdown_renderer():
+def find_markdown_renderer() -> Optional[Callable[[str], str]]:
+    """Return an in-process markdown to HTML converter if one is installed.
+
+    Returns:
+    * (Optional[Callable[[str], str]]):
+      The `markdown.markdown` function from the
+      [Python-Markdown](https://python-markdown.github.io/) package if it is installed, and None
+      otherwise.
+
+    """
+    try:
+        import markdown  # type: ignore
+    except ImportError:  # pragma: no unit cover
+        return None
+    return cast(Callable[[str], str], markdown.markdown)
+
+
 # Arguments:
 @dataclass
 class Arguments:
@@ -571,8 +1127,12 @@ class Arguments:
       A list of error strings that get generated.
     * unit_test* (bool):
     * *markdown_program* (Optional[Path]):
+    * *markdown_renderer* (Optional[Callable[[str], str]]):
+      An in-process markdown to HTML converter.  It is cleared by `--markdown=...`.
     * *sorted_python_files* (Tuple[PyFile, ...]):
       The PyFile's sorted by their Path name.
+    * *docs_directory* (Path):
+      The directory that subsequent `.md` and `.html` files are written into.
 
     Constructor:
     * Arguments(arguments)  # See Arguments.__post_init__() for more details
@@ -584,7 +1144,9 @@ class Arguments:
     errors: List[str] = field(init=False)
     unit_test: bool = field(init=False)
     markdown_program: Optional[str] = field(init=False)
+    markdown_renderer: Optional[Callable[[str], str]] = field(init=False, repr=False)
     sorted_python_files: Tuple[PyFile, ...] = field(init=False)
+    docs_directory: Path = field(init=False)
 
     def __post_init__(self) -> None:
         """Process the command line arguments and generate any associated PyFile's and errors.
@@ -609,10 +1171,11 @@ class Arguments:
         self.errors = []
         self.unit_test = False
         self.markdown_program = None
+        self.markdown_renderer = find_markdown_renderer()
         self.sorted_python_files = ()
 
         # Default to `cmark` program.  Default to None if not found.
-        markdown_program: Optional[str] = shutil.which("cmark")
+        markdown_program: Optional[str] = cached_which("cmark")
         if markdown_program:
             self.markdown_program = markdown_program
 
@@ -625,64 +1188,161 @@ class Arguments:
                 break
         else:  # pragma: no unit cover
             self.errors.append("No docs directory found")
+        self.docs_directory = docs_directory
+
+        # Each flag is dispatched with a single lookup on the text up to and including any `=`:
+        flag_handlers: Dict[str, Callable[[str], None]] = {
+            "--docs=": self.process_docs_flag,
+            "--markdown=": self.process_markdown_flag,
+            "--unit-test": self.process_unit_test_flag,
+        }
 
         # Scan *arguments* from left to right:
-        directory_flag_prefix: str = "--docs="
-        markdown_flag_prefix: str = "--markdown="
         python_path: Path
         argument: str
         for argument in self.arguments:
             if argument.startswith("--"):
-                if argument.startswith(directory_flag_prefix):
-                    # directory=
-                    directory_flag: str = argument[len(directory_flag_prefix):]
-                    new_docs_directory: Path = Path(directory_flag)
-                    if not new_docs_directory.is_dir():
-                        self.errors.append(f"{directory_flag} is not a directory")
-                    elif not os.access(directory_flag, os.W_OK):
-                        self.errors.append(f"Directory {directory_flag} is not writable")
-                    else:
-                        docs_directory = new_docs_directory
-                elif argument.startswith(markdown_flag_prefix):
-                    # markdown=
-                    markdown_flag: str = argument[len(markdown_flag_prefix):]
-                    new_markdown_program: Optional[str] = shutil.which(markdown_flag)
-                    if new_markdown_program:
-                        self.markdown_program = new_markdown_program
-                    else:
-                        self.errors.append(f"{markdown_flag} program does not exist")
-                elif argument == "--unit-test":
-                    self.unit_test = True
+                flag: str
+                equals: str
+                value: str
+                flag, equals, value = argument.partition("=")
+                flag_handler: Optional[Callable[[str], None]] = flag_handlers.get(flag + equals)
+                if flag_handler:
+                    flag_handler(value)
                 else:
                     self.errors.append(f"{argument} not a valid flag")
             elif argument.endswith(".py"):
                 python_path = Path(argument)
                 if python_path.exists():
                     py_base: str = argument[:-3]
-                    md_path: Path = docs_directory / f"{py_base}.md"
-                    html_path: Path = docs_directory / f"{py_base}.html"
-                    print(f"---------->{docs_directory=} {md_path=} {html_path=}")
-                    python_file = PyFile(python_path, md_path, html_path, markdown_program)
+                    md_path: Path = self.docs_directory / f"{py_base}.md"
+                    html_path: Path = self.docs_directory / f"{py_base}.html"
+                    python_file = PyFile(python_path, md_path, html_path,
+                                         self.markdown_program, self.markdown_renderer)
                     self.python_files.append(python_file)
                 else:
                     self.errors.append(f"{argument} Python file does not exist")
             else:
                 directory_path: Path = Path(argument)
                 if directory_path.is_dir():
-                    self.scan_directory(directory_path, docs_directory)
+                    self.scan_directory(directory_path, self.docs_directory)
                 else:
                     self.errors.append(f"{argument} is not a directory")
 
         # If no Python files are specified scan the current working directory.
         if not self.python_files:
-            self.scan_directory(current_working_directory, docs_directory)
+            self.scan_directory(current_working_directory, self.docs_directory)
+
+        # Sort on the path components (plain strings) rather than hashing and comparing Path's.
+        # *python_files* is sorted in place, so the only copy made is the final tuple:
+        self.python_files.sort(key=lambda python_file: python_file.py_path.parts)
+        self.sorted_python_files = tuple(self.python_files)
+
+    # Arguments.process_docs_flag():
+    def process_docs_flag(self, directory_flag: str) -> None:
+        """Process a `--docs=DOCS_DIR` flag.
+
+        Arguments:
+        * *directory_flag* (str): The text after the `=`.
+
+        """
+        new_docs_directory: Path = Path(directory_flag)
+        if not new_docs_directory.is_dir():
+            self.errors.append(f"{directory_flag} is not a directory")
+        elif not os.access(directory_flag, os.W_OK):
+            self.errors.append(f"Directory {directory_flag} is not writable")
+        else:
+            self.docs_directory = new_docs_directory
+
+    # Arguments.process_markdown_flag():
+    def process_markdown_flag(self, markdown_flag: str) -> None:
+        """Process a `--markdown=MARKDOWN` flag.
+
+        Arguments:
+        * *markdown_flag* (str): The text after the `=`.
+
+        """
+        new_markdown_program: Optional[str] = cached_which(markdown_flag)
+        if new_markdown_program:
+            self.markdown_program = new_markdown_program
+            self.markdown_renderer = None  # An explicit program takes precedence.
+        else:
+            self.errors.append(f"{markdown_flag} program does not exist")
+
+    # Arguments.process_unit_test_flag():
+    def process_unit_test_flag(self, unused_value: str) -> None:
+        """Process the `--unit-test` flag.
+
+        Arguments:
+        * *unused_value* (str): Always empty, since `--unit-test` does not take a value.
+
+        """
+        self.unit_test = True
 
-        python_files_table: Dict[Path, PyFile] = {python_file.py_path: python_file
-                                                  for python_file in self.python_files}
-        sorted_py_paths: Tuple[Path, ...] = tuple(
-            sorted(python_file.py_path for python_file in self.python_files))
-        py_path: Path
-        self.sorted_python_files = tuple(python_files_table[py_path] for py_path in sorted_py_paths)
+    # Arguments.process_all():
+    def process_all(self, build_cache: Optional[BuildCache] = None,
+                    tracing: str = "") -> Tuple[List[PyModule], List[str]]:
+        """Process all of the Python files.
+
+        Arguments:
+        * *build_cache* (Optional[BuildCache]):
+          When present, Python files whose generated files are already up to date are skipped.
+
+        Returns:
+        * (Tuple[List[PyModule], List[str]]):
+          The generated PyModule's and any errors, both in *sorted_python_files* order.
+
+        Each Python file is parsed and rendered independently of the others, so when there are
+        enough of them, they are spread across a pool of worker processes.  Otherwise, the files
+        are processed in this process and their markdown program HTML conversions are collected
+        and run together on a pool of threads.
+
+        """
+        next_tracing: str = tracing + " " if tracing else ""
+        if tracing:
+            print(f"{tracing}=>Arguments.process_all()")
+
+        # The build cache is only consulted here, so it never needs to be shared with workers:
+        python_files: List[PyFile] = [
+            python_file for python_file in self.sorted_python_files
+            if build_cache is None or not build_cache.is_current(python_file)]
+        process: Callable[[PyFile], Tuple[Optional[PyModule], List[str]]] = functools.partial(
+            PyFile.process, tracing=next_tracing)
+        results: List[Tuple[Optional[PyModule], List[str]]]
+        conversions: List[HtmlConversion] = []
+        if len(python_files) >= _PARALLEL_THRESHOLD:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor: ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(process, python_files))
+        else:
+            results = [process(python_file, conversions) for python_file in python_files]
+
+        modules: List[PyModule] = []
+        errors: List[str] = []
+        py_module: Optional[PyModule]
+        file_errors: List[str]
+        for py_module, file_errors in results:
+            if py_module is not None:
+                modules.append(py_module)
+            errors.extend(file_errors)
+
+        # Each conversion runs the markdown program in its own process, so threads are enough
+        # to overlap them:
+        if conversions:
+            from concurrent.futures import ThreadPoolExecutor
+
+            thread_executor: ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as thread_executor:
+                conversion_error: Optional[str]
+                for conversion_error in thread_executor.map(HtmlConversion.run, conversions):
+                    if conversion_error:
+                        errors.append(conversion_error)  # pragma: no unit cover
+
+        if tracing:
+            print(f"{tracing}<=Arguments.process_all()=>{len(modules)}, {len(errors)}")
+        return modules, errors
 
     # Arguments.scan_directory():
     def scan_directory(self, directory_path: Path, docs_directory: Path, tracing: str = "") -> None:
@@ -698,22 +1358,36 @@ class Arguments:
         * Nothing
 
         """
-        for python_path in directory_path.glob("*.py"):
-            python_base: str = python_path.stem
-            html_path: Path = docs_directory / f"{python_base}.html"
-            md_path: Path = docs_directory / f"{python_base}.md"
-            python_file: PyFile = PyFile(
-                python_path, md_path, html_path, self.markdown_program)
-            self.python_files.append(python_file)
-        else:
+        # `os.scandir()` returns the file names and types from one directory read, so a Path is
+        # only constructed for the Python files themselves.  Each one is turned into a PyFile as
+        # soon as it is found rather than being collected into an intermediate list first:
+        found: bool = False
+        directory_entries: Iterator[os.DirEntry]
+        directory_entry: os.DirEntry
+        with os.scandir(directory_path) as directory_entries:
+            for directory_entry in directory_entries:
+                python_name: str = directory_entry.name
+                if (python_name.endswith(".py") and not python_name.startswith(".")
+                        and directory_entry.is_file()):
+                    found = True
+                    python_base: str = python_name[:-3]
+                    html_path: Path = docs_directory / f"{python_base}.html"
+                    md_path: Path = docs_directory / f"{python_base}.md"
+                    python_file: PyFile = PyFile(directory_path / python_name, md_path, html_path,
+                                                 self.markdown_program, self.markdown_renderer)
+                    self.python_files.append(python_file)
+        if not found:
             self.errors.append(f"There are no Python (.py) files in {directory_path}")
 
     # Arguments.unit_tests():
     def unit_tests(self, tracing: str = ""):
         """Run unit tests on Arguments."""
+        import tempfile
+
         # Test the argument parsing.
         # next_tracing: str = tracing + " " if tracing else ""
-        print(f"{tracing}=>unit_tests()")
+        if tracing:
+            print(f"{tracing}=>unit_tests()")
         arguments: Arguments
         temporary_directory: str
         with tempfile.TemporaryDirectory() as temporary_directory:
@@ -749,9 +1423,11 @@ class Arguments:
         # If no python files are listed, the current working directory is scanned.
         arguments = Arguments(())
         errors = tuple(arguments.errors)
-        assert errors[0].startswith("There are no Python (.py) files in "), errors[0]
+        assert not errors, errors
+        assert arguments.sorted_python_files, "No Python files found in current directory"
 
-        print(f"{tracing}<=unit_tests()")
+        if tracing:
+            print(f"{tracing}<=unit_tests()")
 
     # if not non_flag_arguments:  # Scan current directory.
     #     non_flag_arguments.append(".")  # pragma: no unit cover
@@ -781,7 +1457,8 @@ def main(tracing: str = "") -> int:
     # Process the command line arguments:
     # module_names: Tuple[str, ...] = ("Not Updated",)
     next_tracing = tracing + " " if tracing else ""
-    print(f"{tracing}=>main()")
+    if tracing:
+        print(f"{tracing}=>main()")
     document_directory: Path
     markdown_program: str
 
@@ -789,28 +1466,32 @@ def main(tracing: str = "") -> int:
     arguments: Arguments = Arguments(command_line_arguments)
     if arguments.unit_test:
         arguments.unit_tests(tracing=next_tracing)
+        # Temporary:
+        arguments2: Arguments2 = Arguments2(command_line_arguments)
+        arguments2.run_unit_tests(tracing=next_tracing)
 
-    # Temporary:
-    arguments2: Arguments2 = Arguments2(command_line_arguments)
-    print(100 * "<")
-    arguments2.run_unit_tests(tracing=next_tracing)
-    print(100 * ">")
-
+    # *sorted_python_files* is already sorted by Arguments, so it is used as is:
     sorted_python_files: Tuple[PyFile, ...] = arguments.sorted_python_files
-    sorted_python_paths: Tuple[Path, ...] = tuple(
-        python_file.py_path for python_file in sorted_python_files)
     if tracing:
+        sorted_python_paths: Tuple[Path, ...] = tuple(
+            python_file.py_path for python_file in sorted_python_files)
         print(f"{tracing}{sorted_python_paths=}")
 
-    modules: List[PyModule] = []
-    errors: List[str] = []
-    for python_file in sorted_python_files:
-        python_file.process(modules, errors, tracing=next_tracing)
+    build_cache: BuildCache = BuildCache(_BUILD_CACHE_PATH)
+    modules: List[PyModule]
+    errors: List[str]
+    modules, errors = arguments.process_all(build_cache, tracing=next_tracing)
 
-    for error in errors:
-        print(error)  # pragma: no unit cover
+    # Only remember what was generated if everything worked:
+    if not errors:
+        build_cache.save()
+
+    # Report all of the errors with one write to standard error:
+    if errors:
+        sys.stderr.write("\n".join(errors) + "\n")  # pragma: no unit cover
     return_code: int = int(len(errors) != 0)
-    print(f"{tracing}<=main()")
+    if tracing:
+        print(f"{tracing}<=main()")
     return return_code
 
 
@@ -855,12 +1536,11 @@ class Arguments2:
         self.arguments = tuple(self.arguments)  # Make sure no accidental changes occur
         self.errors = []
         self.markdown_path = None
-        which_markdown: Optional[str] = shutil.which("markdown")
+        which_markdown: Optional[str] = cached_which("markdown")
         if which_markdown:
             self.markdown_path = Path(which_markdown)
-        readme: Path = Path("README.md")
-        if Arguments2.check_file_writable(str(readme)):
-            self.output_path = readme
+        if Arguments2.check_file_writable(str(_README_PATH)):
+            self.output_path = _README_PATH
         self.python_paths = []
         self.package_paths = []
         self.unit_tests = False
@@ -876,32 +1556,34 @@ class Arguments2:
             print("")
             print(f"{tracing}=>Arguments2.process_arguments('{label}')")
 
-        # Execute each process method in turn until one succeeds:
+        # Each flag is dispatched directly to its match method using the text before any `=`:
+        flag_matchers: Dict[str, Callable[..., bool]] = {
+            "--markdown": self.match_markdown_flag,
+            "--outfile": self.match_output_flag,
+            "--unit-tests": self.match_unit_tests_flag,
+        }
+
         errors: List[str] = self.errors
+        path_given: bool = False
         argument: str
         index: int
         for index, argument in enumerate(self.arguments):
-            # Attempt to process each different argument flag and stop after first one succeeds.
+            # Anything that is not a matched flag is treated as a file or directory:
             if tracing:
                 print(f"{tracing}Argument[{index}]: {argument}")
-            if self.match_markdown_flag(argument, tracing=next_tracing):
-                pass
-            elif self.match_output_flag(argument, tracing=next_tracing):
-                pass
-            elif self.match_unit_tests_flag(argument, tracing=next_tracing):
-                pass
-            elif self.match_file_or_directory(argument, tracing=next_tracing):
-                pass
-            else:
-                file_or_dir: Path = Path(argument)
-                if not file_or_dir.exists():
-                    errors.append(f"{file_or_dir} is neither a file nor directory")
-                elif file_or_dir.is_dir():
-                    self.scan_directory(file_or_dir, errors)
-                else:
-                    errors.append(f"Unable to process argument '{argument}'")
-        if not self.python_paths:
-            self.scan_directory(Path("."), errors)
+            # Only arguments that start with `--` can be flags; everything else skips the lookup:
+            flag_matcher: Optional[Callable[..., bool]] = None
+            if argument.startswith("--"):
+                flag_matcher = flag_matchers.get(argument.partition("=")[0])
+            # match_file_or_directory() reports its own errors, so its result is not needed:
+            if not (flag_matcher and flag_matcher(argument, tracing=next_tracing)):
+                path_given = True
+                self.match_file_or_directory(argument, tracing=next_tracing)
+        # The current directory is only the default when no files or directories were given.
+        # A file or directory argument that failed has already been reported as an error, so
+        # there is no point in scanning the current directory as well:
+        if not path_given:
+            self.scan_directory(_CURRENT_DIRECTORY, errors)
 
         if tracing:
             print(f"{tracing}<=Arguments2.process_arguments('{label}')")
@@ -917,20 +1599,23 @@ class Arguments2:
             True if a match is found and False otherwise.
 
         """
-        print(f"{tracing}=>>Arguments2.match_markdown_flag()")
-        MARKDOWN_PREFIX: str = "--markdown="
-        print(f"{tracing}Arguments2._march_markdown_flag: {argument=}")
+        if tracing:
+            print(f"{tracing}=>Arguments2.match_markdown_flag({argument=})")
+        flag: str
+        equals: str
+        markdown_text: str
+        flag, equals, markdown_text = argument.partition("=")
         match: bool = False
-        if argument.startswith(MARKDOWN_PREFIX):
-            markdown_text: str = argument[len(MARKDOWN_PREFIX):]
-            markdown_file: Optional[str] = shutil.which(markdown_text)
+        if equals and flag == "--markdown":
+            markdown_file: Optional[str] = cached_which(markdown_text)
             if markdown_file:
                 self.markdown_path = Path(markdown_file)
                 # assert False, f"{argument=} {markdown_text=} {markdown_path=} {self.markdown=}"
                 match = True
             else:
                 self.errors.append(f"'{argument}': {markdown_text} executable not found")
-        print(f"{tracing}<=Arguments2.match_markdown_flag()=>{match}")
+        if tracing:
+            print(f"{tracing}<=Arguments2.match_markdown_flag()=>{match}")
         return match
 
     # Arguments2.match_output_flag():
@@ -946,10 +1631,13 @@ class Arguments2:
         """
         if tracing:
             print(f"{tracing}=>Arguments2.match_output_flag()")
-        OUTPUT_PREFIX: str = "--outfile="
+        flag: str
+        equals: str
+        value: str
+        flag, equals, value = argument.partition("=")
         match: bool = False
-        if argument.startswith(OUTPUT_PREFIX):
-            output_path: Path = Path(argument[len(OUTPUT_PREFIX):])
+        if equals and flag == "--outfile":
+            output_path: Path = Path(value)
             if self.check_file_writable(str(output_path)):
                 self.output_path = output_path
                 match = True
@@ -993,16 +1681,24 @@ class Arguments2:
         if tracing:
             print(f"{tracing}=>Arguments2._match_file_or_directory('{argument}')")
 
-        path: Path = Path(argument)
+        # A single `os.stat()` answers both the exists and the is directory questions.  The
+        # argument is classified as a plain string and a Path is only built once it is kept:
         match: bool = False
-        if path.exists():
-            if path.suffix == ".py":
-                self.python_paths.append(Path(path))
+        is_directory: bool = False
+        try:
+            path_stat: os.stat_result = os.stat(argument)
+        except OSError:
+            pass  # The path does not exist.
+        else:
+            if argument.endswith(".py") and stat.S_ISREG(path_stat.st_mode):
+                self.python_paths.append(Path(argument))
                 match = True
-            elif path.is_dir():
-                match = self.scan_directory(path, self.errors)
+            elif stat.S_ISDIR(path_stat.st_mode):
+                is_directory = True
+                match = self.scan_directory(Path(argument), self.errors)
 
-        if not match:
+        # A directory without Python files has already been reported by scan_directory():
+        if not match and not is_directory:
             self.errors.append(
                 f"'{argument}' is neither Python file, package, nor directory.")
 
@@ -1016,7 +1712,8 @@ class Arguments2:
         """Scan a directory for Python files.
 
         Args:
-        * directory (Path): The directory of Pythongfiles to process.
+        * directory (Path): The directory of Pythongfiles to process.  The caller has already
+          checked that it is a directory.
         * errors (List[str]): An error list to append errors to.
 
         Returns:
@@ -1025,16 +1722,15 @@ class Arguments2:
         """
         if tracing:
             print(f"{tracing}=>Arguments2.scan_directory()")
-        assert directory.is_dir(), f"{directory} is not a directory"
-        match: bool = False
-
-        file_path: Path
-        for file_path in directory.glob("*.py"):
-            if file_path.suffix == ".py":
-                self.python_paths.append(file_path)
-                match = True
-            if file_path.name == "__init__.py":
-                self.package_paths.append(directory)
+        # Repeated scans of an unchanged directory (e.g. the current directory default) reuse the
+        # names from the first scan; a Path is only built for the Python files:
+        python_names: Tuple[str, ...] = python_file_names(
+            os.path.abspath(directory), os.stat(directory).st_mtime_ns)
+        python_paths: List[Path] = [directory / python_name for python_name in python_names]
+        self.python_paths.extend(python_paths)
+        if "__init__.py" in python_names:
+            self.package_paths.append(directory)
+        match: bool = bool(python_paths)
         if not match:
             self.errors.append(f"{directory} does not contain any Python files")
         if tracing:
@@ -1054,9 +1750,14 @@ class Arguments2:
 
         """
         # See [Section 3.2](https://www.novixys.com/blog/python-check-file-can-read-write/):
-        if os.path.exists(file_name):
+        # A single `os.stat()` replaces the separate exists and is file checks:
+        try:
+            file_stat: os.stat_result = os.stat(file_name)
+        except OSError:
+            pass  # Fall through to checking the parent directory.
+        else:
             # path exists
-            if os.path.isfile(file_name):  # is it a file or a dir?
+            if stat.S_ISREG(file_stat.st_mode):  # is it a file or a dir?
                 # also works when file is a link and the target is writable
                 return os.access(file_name, os.W_OK)
             else:
@@ -1086,55 +1787,57 @@ class Arguments2:
 
         def check_error(arguments: Sequence[str], want_error: str, tracing: str = "") -> None:
             """Verify that an error message is generated."""
-            print(f"{tracing}=>Arguments2.check_error({arguments}, '{want_error}')")
+            if tracing:
+                print(f"{tracing}=>Arguments2.check_error({arguments}, '{want_error}')")
             arguments2: Arguments2 = Arguments2(arguments)
             if tracing:
-                print(f"{tracing}{self.errors=}")
+                print(f"{tracing}{arguments2.errors=}")
             assert len(arguments2.errors) >= 1, (
                 f"{arguments} did not generate an error '{want_error}'")
             got_error: str = arguments2.errors[0]
             assert got_error == want_error, f"Error mismatch \n{want_error=}\n {got_error=}"
-            print(f"{tracing}<=Arguments2.check_error({arguments}, '{want_error}')")
-
-        # foo.py does not exist:
-        check_error(["foo.py"],
-                    "'foo.py' is neither Python file, package, nor directory.",
-                    tracing=next_tracing)
-        # test/package2 exists but does not have a `__init__.py` in it:
-        check_error(["test/package2"],
-                    "test/package2 does not contain any Python files", tracing=next_tracing)
-
+            if tracing:
+                print(f"{tracing}<=Arguments2.check_error({arguments}, '{want_error}')")
+
+        # Each error case is an (argument, expected first error) pair:
+        error_cases: Tuple[Tuple[str, str], ...] = (
+            # foo.py does not exist:
+            ("foo.py", "'foo.py' is neither Python file, package, nor directory."),
+            # test/package2 exists but does not have a `__init__.py` in it:
+            ("test/package2", "test/package2 does not contain any Python files"),
+            ("--markdown=LICENSE", "'--markdown=LICENSE': LICENSE executable not found"),
+            ("--outfile=/bogus.md", "Unable to write to /bogus.md"),
+            # Test that bogus file gets flagged as an error:
+            ("test/error.txt", "'test/error.txt' is neither Python file, package, nor directory."),
+        )
+        error_argument: str
+        want_error: str
+        for error_argument, want_error in error_cases:
+            check_error((error_argument,), want_error, tracing=next_tracing)
+
+        # Each Arguments2 below has already processed its arguments in its constructor.
         # `test/package1` does have an `__init__.py` files, so this should work:
         args2: Arguments2 = Arguments2(["test/package1"])
-        args2.process_arguments('test/package1', tracing=next_tracing)
         path0: Path = args2.package_paths[0]
-        assert f"{str(path0)}" == "test/package1", "somehow test/package1 is not OK "
+        assert str(path0) == "test/package1", "somehow test/package1 is not OK "
 
         # Test that "--markdown=" works:
         args2 = Arguments2(["--markdown=cmark"])  # This assumes `cmark` is isntalled.
-        args2.process_arguments("--markdown=cmark", tracing=next_tracing)
         assert isinstance(args2.markdown_path, Path)
-        assert f"{args2.markdown_path.name}" == "cmark", (
+        assert args2.markdown_path.name == "cmark", (
             f"{args2.markdown_path.name} does not match 'cmark'")
-        check_error(["--markdown=LICENSE"],
-                    "'--markdown=LICENSE': LICENSE executable not found", tracing=next_tracing)
 
         # Test that "--outfile=" works:
         args2 = Arguments2(["--outfile=/tmp/README.md"])
-        args2.process_arguments("-outile=/tmp/README.md", tracing=next_tracing)
-        tmp_readme_md: Path = Path("/tmp/README.md")
-        assert f"{args2.output_path}" == f"{tmp_readme_md}", (
-            f"'{args2.output_path}' != '{tmp_readme_md}'")
-        check_error(["--outfile=/bogus.md"], "Unable to write to /bogus.md", tracing=next_tracing)
+        assert str(args2.output_path) == "/tmp/README.md", (
+            f"'{args2.output_path}' != '/tmp/README.md'")
 
         # Test that "--unit-tests" works:
         args2 = Arguments2(["--unit-tests"])
-        args2.process_arguments("--unit-tests", tracing=next_tracing)
         assert args2.unit_tests, "--unit-tests did not work"
 
         # Test that explicitly specifying .py file works:
         args2 = Arguments2(["docstrex.py"])
-        args2.process_arguments("docstrex.py", tracing=next_tracing)
         assert not args2.errors, "Unexpexted errors found"
         assert args2.python_paths
         python_path0: Path = args2.python_paths[0]
@@ -1142,22 +1845,16 @@ class Arguments2:
 
         # Test that no arguments works:
         args2 = Arguments2([])
-        args2.process_arguments("empty", tracing=next_tracing)
         markdown_path: Optional[Path] = args2.markdown_path
         assert isinstance(markdown_path, Path)
-        assert f"{markdown_path.name}" == "markdown", args2
+        assert markdown_path.name == "markdown", args2
         output_path: Path = args2.output_path
-        assert f"{output_path}" == "README.md", args2
+        assert str(output_path) == "README.md", args2
         assert not args2.unit_tests, args2
         assert len(args2.errors) == 0, args2
         assert len(args2.arguments) == 0, args2.arguments
         assert len(args2.python_paths) == 2, args2  # __init__.py and docstrx.py
 
-        # Test that bogus file gets flagged as an error:
-        check_error(["test/error.txt"],
-                    "'test/error.txt' is neither Python file, package, nor directory.",
-                    tracing=next_tracing)
-
         if tracing:
             print(f"{tracing}<=Arguments2.run_unit_tests()")
 
@@ -1195,4 +1892,4 @@ class Arguments2:
 """
 
 if __name__ == "__main__":
-    main(tracing=" ")
+    main(tracing=_TRACING)